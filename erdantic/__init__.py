@@ -1,11 +1,6 @@
 from erdantic.erd import create, draw, EntityRelationshipDiagram, to_dot
-import erdantic.pydantic  # noqa: F401
-import erdantic.dataclasses  # noqa: F401
-from erdantic.version import __version__
 from erdantic.enums import Orientation
 
-__version__
-
 __all__ = [
     "create",
     "draw",
@@ -13,3 +8,16 @@ __all__ = [
     "Orientation",
     "to_dot",
 ]
+
+
+def __getattr__(name: str):
+    from importlib import import_module
+
+    # Model adapter modules are imported on first use so that importing erdantic doesn't import
+    # every supported data modeling framework
+    if name in ("dataclasses", "pydantic"):
+        return import_module(f"{__name__}.{name}")
+    # Looking up the installed version loads importlib.metadata, which is slow to import
+    if name == "__version__":
+        return import_module(f"{__name__}.version").__version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
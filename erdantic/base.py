@@ -1,13 +1,28 @@
 from abc import ABC, abstractmethod
+from importlib import import_module
 import inspect
-from typing import Any, Callable, Dict, Generic, List, Optional, Type, TypeVar, Union
-from typing import Callable
+import sys
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from weakref import WeakKeyDictionary
 
 from erdantic.exceptions import InvalidModelAdapterError, ModelAdapterNotFoundError
-from erdantic.typing import Final, repr_type
+from erdantic.typing import cached_property, Final, repr_type
 
 
-_row_template = """<tr><td>{name}</td><td port="{name}">{type_name}</td></tr>"""
+_row_template = """<tr><td>{0}</td><td port="{0}">{1}</td></tr>"""
+_format_row = _row_template.format
 
 
 FT = TypeVar("FT", bound=Any, covariant=True)
@@ -74,7 +89,7 @@ class Field(ABC, Generic[FT]):
         Returns:
             str: DOT language for table row
         """
-        return _row_template.format(name=self.name, type_name=self.type_name)
+        return _format_row(self.name, self.type_name)
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, type(self)) and hash(self) == hash(other)
@@ -88,10 +103,11 @@ class Field(ABC, Generic[FT]):
 
 _table_template = """
 <<table border="0" cellborder="1" cellspacing="0">
-<tr><td port="_root" colspan="2"><b>{name}</b></td></tr>
-{rows}
+<tr><td port="_root" colspan="2"><b>{0}</b></td></tr>
+{1}
 </table>>
 """
+_format_table = _table_template.format
 
 
 MT = TypeVar("MT", bound=type, covariant=True)
@@ -127,6 +143,11 @@ class Model(ABC, Generic[MT]):
         """List of fields defined on this data model."""
         pass
 
+    @cached_property
+    def field_index(self) -> Dict[Field, int]:
+        """Mapping of each field defined on this data model to its position in `fields`."""
+        return {field: index for index, field in enumerate(self.fields)}
+
     @staticmethod
     @abstractmethod
     def is_model_type(obj: Any) -> bool:  # pragma: no cover
@@ -147,7 +168,7 @@ class Model(ABC, Generic[MT]):
             out += "\n\n" + docstring + "\n"
         return out
 
-    @property
+    @cached_property
     def key(self) -> str:
         """Human-readable unique identifier for this data model. Should be stable across
         sessions."""
@@ -162,7 +183,7 @@ class Model(ABC, Generic[MT]):
             str: DOT language for table
         """
         rows = "\n".join(field.dot_row() for field in self.fields)
-        return _table_template.format(name=self.name, rows=rows).replace("\n", "")
+        return _format_table(self.name, rows).replace("\n", "")
 
     def __eq__(self, other) -> bool:
         return isinstance(other, type(self)) and hash(self) == hash(other)
@@ -181,7 +202,86 @@ class Model(ABC, Generic[MT]):
 
 model_adapter_registry: Dict[str, Type[Model]] = {}
 """Registry of concrete [`Model`][erdantic.base.Model] adapter subclasses. A concrete `Model`
-subclass must be registered for it to be available to the diagram creation workflow."""
+subclass must be registered for it to be available to the diagram creation workflow. Use
+[`register_model_adapter`][erdantic.base.register_model_adapter] to add adapters. If this
+dictionary is modified directly, call
+[`clear_model_adapter_cache`][erdantic.base.clear_model_adapter_cache] afterwards."""
+
+_builtin_model_adapter_modules: Dict[str, Tuple[str, str]] = {
+    "dataclasses": ("erdantic.dataclasses", "dataclasses"),
+    "pydantic": ("erdantic.pydantic", "pydantic"),
+}
+"""Registry keys of erdantic's built-in model adapters mapped to the module defining each adapter
+and the module of the data modeling framework it adapts. Adapter modules are only imported once
+needed so that, e.g., importing erdantic doesn't import Pydantic."""
+
+
+def iter_model_adapters() -> Iterator[Type[Model]]:
+    """Iterate through registered concrete [`Model`][erdantic.base.Model] adapter subclasses.
+    Built-in adapters that aren't registered yet are imported and yielded only after the
+    registered adapters have been exhausted, and only if their data modeling framework has been
+    imported, since otherwise no data model classes from that framework can exist.
+
+    Yields:
+        Iterator[Type[Model]]: Concrete `Model` adapter subclasses
+    """
+    yield from list(model_adapter_registry.values())
+    for type_name, (module_name, framework_name) in _builtin_model_adapter_modules.items():
+        # Skip keys already taken, e.g., by a user adapter overriding a built-in one
+        if (
+            type_name not in model_adapter_registry
+            and module_name not in sys.modules
+            and framework_name in sys.modules
+        ):
+            import_module(module_name)
+            yield model_adapter_registry[type_name]
+
+
+def _find_model_adapter(obj: Any) -> Optional[Type[Model]]:
+    for model_adapter in iter_model_adapters():
+        if model_adapter.is_model_type(obj):
+            return model_adapter
+    return None
+
+
+_model_adapter_cache: "WeakKeyDictionary[Any, Optional[Type[Model]]]" = WeakKeyDictionary()
+"""Cache of model adapter lookups. Keys are held weakly so that cached classes, such as models
+created dynamically, can still be garbage collected."""
+
+_MISSING = object()
+
+
+def clear_model_adapter_cache():
+    """Clear cached results of [`find_model_adapter`][erdantic.base.find_model_adapter]. This
+    happens automatically when a model adapter is registered, but must be called after modifying
+    `model_adapter_registry` directly."""
+    _model_adapter_cache.clear()
+
+
+def find_model_adapter(obj: Any) -> Optional[Type[Model]]:
+    """Find the registered concrete [`Model`][erdantic.base.Model] adapter subclass that works
+    with the given object. Results are cached per class, and the cache is cleared whenever a new
+    model adapter is registered.
+
+    Args:
+        obj (Any): Data model class to find a model adapter for
+
+    Returns:
+        Optional[Type[Model]]: Concrete `Model` adapter subclass, or None if obj does not match
+            any registered model adapter
+    """
+    if not isinstance(obj, type):
+        # Only classes are cached. Other objects, e.g., typing.Literal or Annotated metadata, may
+        # not be hashable, weakly referenceable or safely comparable
+        return _find_model_adapter(obj)
+    try:
+        model_adapter = _model_adapter_cache.get(obj, _MISSING)
+    except TypeError:
+        # Classes whose metaclass makes them unhashable can't be cached
+        return _find_model_adapter(obj)
+    if model_adapter is _MISSING:
+        model_adapter = _model_adapter_cache[obj] = _find_model_adapter(obj)
+    return model_adapter
 
 
 def register_model_adapter(type_name: str) -> Callable[[type], type]:
@@ -205,6 +305,7 @@ def register_model_adapter(type_name: str) -> Callable[[type], type]:
                 "registered as erdantic model adapters."
             )
         model_adapter_registry[type_name] = cls
+        clear_model_adapter_cache()
         return cls
 
     return decorator
@@ -212,6 +313,12 @@ def register_model_adapter(type_name: str) -> Callable[[type], type]:
 
 def get_model_adapter(key_or_adapter: Union[str, type]):
     if isinstance(key_or_adapter, str):
+        if (
+            key_or_adapter not in model_adapter_registry
+            and key_or_adapter in _builtin_model_adapter_modules
+        ):
+            module_name, _ = _builtin_model_adapter_modules[key_or_adapter]
+            import_module(module_name)
         try:
             return model_adapter_registry[key_or_adapter]
         except KeyError:
@@ -59,24 +59,31 @@ def main(
     )
 
     if out:
+        dot = diagram.to_dot()
         if include_dot:
             with open(str(out) + ".dot", "w") as dot_file:
-                dot_file.write(diagram.to_dot())
+                dot_file.write(dot)
 
-        diagram.draw(out)
+        diagram.draw(out, dot=dot)
         typer.echo(f"Rendered diagram to {out} and .dot to {out}.dot")
     else:
         typer.echo(diagram.to_dot())
 
 
 def import_object_from_name(full_obj_name):
-    # Try to import as a module
-    try:
-        return import_module(full_obj_name)
-    except ModuleNotFoundError:
+    # Most inputs are model classes, so first try importing the parent module and looking up the
+    # last name on it. This avoids a failed import, which is slow, for every class.
+    if "." in full_obj_name:
+        module_name, obj_name = full_obj_name.rsplit(".", 1)
         try:
-            module_name, obj_name = full_obj_name.rsplit(".", 1)
             module = import_module(module_name)
-            return getattr(module, obj_name)
-        except (ImportError, AttributeError):
-            raise ModelOrModuleNotFoundError(f"{full_obj_name} not found")
+        except ModuleNotFoundError:
+            pass
+        else:
+            if hasattr(module, obj_name):
+                return getattr(module, obj_name)
+    # Otherwise try to import as a module
+    try:
+        return import_module(full_obj_name)
+    except ImportError:
+        raise ModelOrModuleNotFoundError(f"{full_obj_name} not found")
@@ -5,7 +5,7 @@ from typing import Any, List, Union
 
 from erdantic.base import Field, Model, register_model_adapter
 from erdantic.exceptions import InvalidFieldError, InvalidModelError
-from erdantic.typing import GenericAlias, get_args, get_origin
+from erdantic.typing import cached_property, GenericAlias, get_args, get_origin
 
 
 class DataClassField(Field[dataclasses.Field]):
@@ -65,6 +65,6 @@ class DataClassModel(Model[type]):
     def is_model_type(obj: Any) -> bool:
         return isinstance(obj, type) and dataclasses.is_dataclass(obj)
 
-    @property
+    @cached_property
     def fields(self) -> List[Field]:
         return [DataClassField(field=f) for f in dataclasses.fields(self.model)]
@@ -1,11 +1,22 @@
-import inspect
+from collections import deque
+from operator import attrgetter
 import os
 from types import ModuleType
-from typing import Any, Iterable, Iterator, List, Sequence, Set, Type, Union
-
-import pygraphviz as pgv
+from typing import (
+    Any,
+    Deque,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+    Union,
+)
 
-from erdantic.base import Field, Model, model_adapter_registry
+from erdantic.base import Field, find_model_adapter, iter_model_adapters, Model
 from erdantic.enums import Orientation
 from erdantic.exceptions import (
     NotATypeError,
@@ -16,7 +27,18 @@ from erdantic.exceptions import (
     UnknownFieldError,
     UnknownModelTypeError,
 )
-from erdantic.typing import get_recursive_args
+from erdantic.typing import cached_property, get_recursive_args
+
+if TYPE_CHECKING:
+    import pygraphviz as pgv
+
+
+def _dot_id(value: str) -> str:
+    """Format a string as a DOT language ID. HTML-like strings, which are enclosed in angle
+    brackets, are passed through as-is and anything else is quoted."""
+    if value.startswith("<") and value.endswith(">"):
+        return value
+    return '"' + value.replace('"', '\\"') + '"'
 
 
 class Edge:
@@ -35,13 +57,15 @@ class Edge:
     target: "Model"
 
     def __init__(self, source: "Model", source_field: "Field", target: "Model"):
-        if source_field not in set(source.fields):
+        if source_field not in source.field_index:
             raise UnknownFieldError(
                 f"source_field {source_field} is not a field of source {source}"
             )
         self.source = source
         self.source_field = source_field
         self.target = target
+        self._hash = hash((source, source_field, target))
+        self._dot_arrowhead: Optional[str] = None
 
     def dot_arrowhead(self) -> str:
         """Arrow shape specification in Graphviz DOT language for this edge's head. See
@@ -52,17 +76,24 @@ class Edge:
         Returns:
             str: DOT language specification for arrow shape of this edge's head
         """
-        cardinality = "crow" if self.source_field.is_many() else "nonetee"
-        modality = (
-            "odot" if self.source_field.is_nullable() or self.source_field.is_many() else "tee"
-        )
-        return cardinality + modality
+        if self._dot_arrowhead is None:
+            is_many = self.source_field.is_many()
+            cardinality = "crow" if is_many else "nonetee"
+            modality = "odot" if self.source_field.is_nullable() or is_many else "tee"
+            self._dot_arrowhead = cardinality + modality
+        return self._dot_arrowhead
 
     def __hash__(self) -> int:
-        return hash((self.source, self.source_field, self.target))
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
-        return isinstance(other, type(self)) and hash(self) == hash(other)
+        return (
+            isinstance(other, type(self))
+            and self._hash == other._hash
+            and self.source == other.source
+            and self.source_field == other.source_field
+            and self.target == other.target
+        )
 
     def __repr__(self) -> str:
         return (
@@ -70,78 +101,84 @@ class Edge:
             f"target={self.target})"
         )
 
-    def __lt__(self, other) -> bool:
-        if isinstance(other, Edge):
-            self_key = (self.source, self.source.fields.index(self.source_field), self.target)
-            other_key = (other.source, other.source.fields.index(other.source_field), other.target)
-            return self_key < other_key
-        return NotImplemented
+
+def _edge_sort_key(edge: Edge) -> Tuple[str, int, str]:
+    return (edge.source.key, edge.source.field_index[edge.source_field], edge.target.key)
 
 
 class EntityRelationshipDiagram:
     """Class for entity relationship diagram.
 
     Attributes:
-        models (List[Model]): Data models (nodes) in diagram.
-        edges (List[Edge]): Edges in diagram, representing the composition relationship between
-            models.
+        models (Tuple[Model, ...]): Data models (nodes) in diagram.
+        edges (Tuple[Edge, ...]): Edges in diagram, representing the composition relationship
+            between models.
     """
 
-    models: List["Model"]
-    edges: List["Edge"]
+    models: Tuple["Model", ...]
+    edges: Tuple["Edge", ...]
     name: str
     orientation: str
 
     def __init__(self, models: Sequence["Model"], edges: Sequence["Edge"], orientation: Orientation = Orientation.HORIZONTAL):
-        self.models = sorted(models)
-        self.edges = sorted(edges)
-        self.name = models[0].name
-        self.orientation = str(orientation)
+        self.models = tuple(sorted(models, key=attrgetter("key")))
+        self.edges = tuple(sorted(edges, key=_edge_sort_key))
+        self.name = self.models[0].name
+        self.orientation = (
+            orientation.value if isinstance(orientation, Orientation) else str(orientation)
+        )
+        self._hash = hash((self.models, self.edges))
 
-    def draw(self, out: Union[str, os.PathLike], **kwargs):
+    def draw(self, out: Union[str, os.PathLike], *, dot: Optional[str] = None, **kwargs):
         """Render entity relationship diagram for given data model classes to file.
 
         Args:
             out (Union[str, os.PathLike]): Output file path for rendered diagram.
+            dot (Optional[str]): DOT language source to render instead of this diagram's own, e.g.,
+                the output of `to_dot` that has already been written elsewhere or modified.
             **kwargs: Additional keyword arguments to [`pygraphviz.AGraph.draw`](https://pygraphviz.github.io/documentation/latest/reference/agraph.html#pygraphviz.AGraph.draw).
         """
-        self.graph().draw(out, prog="dot", **kwargs)
+        if dot is None:
+            graph = self.graph()
+        else:
+            import pygraphviz as pgv
+
+            graph = pgv.AGraph(string=dot)
+        graph.draw(out, prog="dot", **kwargs)
 
-    def graph(self) -> pgv.AGraph:
+    def graph(self) -> "pgv.AGraph":
         """Return [`pygraphviz.AGraph`](https://pygraphviz.github.io/documentation/latest/reference/agraph.html)
-        instance for diagram.
+        instance for diagram. A new graph is parsed from the diagram's DOT source on every call,
+        because rendering writes layout attributes into the graph.
 
         Returns:
             pygraphviz.AGraph: graph object for diagram
         """
-        g = pgv.AGraph(
-            directed=True,
-            strict=False,
-            nodesep=0.5,
-            ranksep=1.5,
-            rankdir=self.orientation,
-            name=self.name,
-            fontsize=9,
-            fontcolor="gray66",
-        )
-        g.node_attr["fontsize"] = 14
-        g.node_attr["shape"] = "plain"
+        # Imported here so that loading the native Graphviz libraries is deferred until rendering
+        import pygraphviz as pgv
+
+        return pgv.AGraph(string=self._dot)
+
+    @cached_property
+    def _dot(self) -> str:
+        lines = [
+            f"digraph {_dot_id(self.name)} {{",
+            "\tgraph [fontcolor=gray66, fontsize=9, nodesep=0.5, ranksep=1.5, "
+            f"rankdir={_dot_id(self.orientation)}];",
+            "\tnode [fontsize=14, shape=plain];",
+        ]
         for model in self.models:
-            label = model.dot_label()
-            g.add_node(
-                model.key,
-                label=label
-            )
+            lines.append(f"\t{_dot_id(model.key)} [label={_dot_id(model.dot_label())}];")
 
         tail_direction = "e"
         for edge in self.edges:
-            g.add_edge(
-                edge.source.key,
-                edge.target.key,
-                tailport=f"{edge.source_field.name}_{tail_direction}:{tail_direction}",
-                arrowhead=edge.dot_arrowhead(),
+            tailport = f"{edge.source_field.name}_{tail_direction}:{tail_direction}"
+            lines.append(
+                f"\t{_dot_id(edge.source.key)} -> {_dot_id(edge.target.key)} "
+                f"[tailport={_dot_id(tailport)}, arrowhead={edge.dot_arrowhead()}];"
             )
-        return g
+        lines.append("}")
+        return "\n".join(lines) + "\n"
 
     def to_dot(self) -> str:
         """Generate Graphviz [DOT language](https://graphviz.org/doc/info/lang.html) representation
@@ -150,10 +187,10 @@ class EntityRelationshipDiagram:
         Returns:
             str: DOT language representation of diagram
         """
-        return self.graph().string()
+        return self._dot
 
     def __hash__(self) -> int:
-        return hash((tuple(self.models), tuple(self.edges)))
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, type(self)) and hash(self) == hash(other)
@@ -202,14 +239,12 @@ def create(
     seen_models: Set[Model] = set()
     seen_edges: Set[Edge] = set()
 
-    for raw_model in models:
-        model = adapt_model(raw_model)
-        search_composition_graph(
-            model=model,
-            seen_models=seen_models,
-            seen_edges=seen_edges,
-            depth_limit=depth_limit
-        )
+    # Search from all requested models at once so that each model is reached at its shallowest
+    # depth from any of them, independent of the order the models were given in
+    queue: Deque[Tuple[Model, int]] = deque((adapt_model(m), 0) for m in models)
+    _search_breadth_first(
+        queue, seen_models=seen_models, seen_edges=seen_edges, depth_limit=depth_limit
+    )
     return EntityRelationshipDiagram(models=list(seen_models), edges=list(seen_edges), orientation=orientation)
 
 
@@ -224,14 +259,16 @@ def find_models(
     Yields:
         Iterator[type]: Members of module that are data model classes.
     """
+    model_adapters: Tuple[Type[Model], ...] = tuple(iter_model_adapters())
+    module_name = module.__name__
 
-    limit_search_models_to_adapters: Iterable[Type[Model]] = model_adapter_registry.values()
-
-    for _, member in inspect.getmembers(module, inspect.isclass):
-        if member.__module__ == module.__name__:
-            for model_adapter in limit_search_models_to_adapters:
-                if model_adapter.is_model_type(member):
-                    yield member
+    # Only classes defined in the module are wanted, so read its namespace directly rather than
+    # using inspect.getmembers, which sorts and calls getattr on every attribute
+    for member in list(vars(module).values()):
+        if not isinstance(member, type) or member.__module__ != module_name:
+            continue
+        if any(model_adapter.is_model_type(member) for model_adapter in model_adapters):
+            yield member
 
 
 def adapt_model(obj: Any) -> Model:
@@ -247,10 +284,38 @@ def adapt_model(obj: Any) -> Model:
     Returns:
         Model: Instantiated concrete `Model` subclass instance
     """
-    for model_adapter in model_adapter_registry.values():
-        if model_adapter.is_model_type(obj):
-            return model_adapter(obj)
-    raise UnknownModelTypeError(model=obj)
+    model_adapter = find_model_adapter(obj)
+    if model_adapter is None:
+        raise UnknownModelTypeError(model=obj)
+    return model_adapter(obj)
+
+
+def _expand(model: Model) -> List[Tuple[Field, Model]]:
+    """Return the outgoing composition relationships of a model as pairs of the field and the
+    adapted component model that the field's type refers to."""
+    targets: List[Tuple[Field, Model]] = []
+    for field in model.fields:
+        try:
+            args = get_recursive_args(field.type_obj)
+        except _UnevaluatedForwardRefError as e:
+            raise UnevaluatedForwardRefError(
+                model=model, field=field, forward_ref=e.forward_ref
+            ) from None
+        except _StringForwardRefError as e:
+            raise StringForwardRefError(
+                model=model, field=field, forward_ref=e.forward_ref
+            ) from None
+        # A field can refer to the same model more than once, e.g., Dict[Model, Model]. Skip
+        # repeats by identity before adapting them or building duplicate edges from them.
+        seen_arg_ids: Set[int] = set()
+        for arg in args:
+            if id(arg) in seen_arg_ids:
+                continue
+            seen_arg_ids.add(id(arg))
+            model_adapter = find_model_adapter(arg)
+            if model_adapter is not None:
+                targets.append((field, model_adapter(arg)))
+    return targets
 
 
 def search_composition_graph(
@@ -260,9 +325,9 @@ def search_composition_graph(
     depth: int = 0,
     depth_limit: int = 1
 ):
-    """Recursively search composition graph for a model, where nodes are models and edges are
-    composition relationships between models. Nodes and edges that are discovered will be added to
-    the two respective provided set instances.
+    """Breadth-first search of the composition graph for a model, where nodes are models and edges
+    are composition relationships between models. Nodes and edges that are discovered will be added
+    to the two respective provided set instances. Each model's fields are only inspected once.
 
     Args:
         model (Model): Root node to begin search.
@@ -271,33 +336,31 @@ def search_composition_graph(
         depth (int): How deep the dependency tree has been searched
         depth_limit (int): How deep within the dependency tree models may be searched for
     """
-    if model not in seen_models:
+    _search_breadth_first(
+        deque([(model, depth)]),
+        seen_models=seen_models,
+        seen_edges=seen_edges,
+        depth_limit=depth_limit,
+    )
+
+
+def _search_breadth_first(
+    queue: Deque[Tuple[Model, int]],
+    seen_models: Set[Model],
+    seen_edges: Set[Edge],
+    depth_limit: int,
+):
+    while queue:
+        model, depth = queue.popleft()
+        if model in seen_models:
+            continue
         seen_models.add(model)
 
         if depth < depth_limit:
-            for field in model.fields:
-                try:
-                    for arg in get_recursive_args(field.type_obj):
-                        try:
-                            field_model = adapt_model(arg)
-                            seen_edges.add(Edge(source=model, source_field=field, target=field_model))
-                            search_composition_graph(
-                                field_model,
-                                seen_models,
-                                seen_edges,
-                                depth=depth + 1,
-                                depth_limit=depth_limit
-                            )
-                        except UnknownModelTypeError:
-                            pass
-                except _UnevaluatedForwardRefError as e:
-                    raise UnevaluatedForwardRefError(
-                        model=model, field=field, forward_ref=e.forward_ref
-                    ) from None
-                except _StringForwardRefError as e:
-                    raise StringForwardRefError(
-                        model=model, field=field, forward_ref=e.forward_ref
-                    ) from None
+            for field, field_model in _expand(model):
+                seen_edges.add(Edge(source=model, source_field=field, target=field_model))
+                if field_model not in seen_models:
+                    queue.append((field_model, depth + 1))
 
 
 def draw(
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import inspect
 import html
-import re
 
 from typing import Any, List, Optional, Type
 
@@ -11,7 +11,7 @@ import pydantic.fields
 
 from erdantic.base import Field, Model, register_model_adapter
 from erdantic.exceptions import InvalidFieldError, InvalidModelError
-from erdantic.typing import repr_type_with_mro
+from erdantic.typing import cached_property, repr_type_with_mro
 
 USE_LEGACY = False
 
@@ -19,31 +19,58 @@ HEADER_ROW_COLOR = "#f3f797"
 DESCRIPTION_ROW_COLOR = "#fcffcc"
 ODD_ROW_COLOR = "#FFFFFF"
 EVEN_ROW_COLOR = "#e3e3e3"
+# Rows are numbered from 1, so the row at index 0 is the first odd row
+_ROW_COLORS = (ODD_ROW_COLOR, EVEN_ROW_COLOR)
 
 CHARACTER_LIMIT = 40
 HEADER_CHARACTER_LIMIT = 100
 
-_table_template = """<<table border="0" cellborder="1" cellpadding="5" cellspacing="0">{header}{rows}</table>>"""
+_TABLE_OPEN = """<<table border="0" cellborder="1" cellpadding="5" cellspacing="0">"""
+_TABLE_CLOSE = "</table>>"
 
-_header_template = """<tr><td bgcolor="{row_color}" port="_root" colspan="{column_count}"><b>{name}</b></td></tr>"""
-_model_description_template = """<tr><td bgcolor="{row_color}" port="description" colspan="{column_count}"><i>{description}</i></td></tr>"""
 
-_row_template = """<tr><td bgcolor="{row_color}" port="{name}_w">{name}</td><td bgcolor="{row_color}" port="{name}_e">{type_name}</td></tr>"""
-_row_with_description = """<tr><td bgcolor="{row_color}" port="{name}_w"><b>{name}</b></td><td bgcolor="{row_color}">{type_name}</td><td bgcolor="{row_color}" port="{name}_e">{description}</td></tr>"""
+def _header_row(row_color: str, column_count: int, name: str) -> str:
+    return f"""<tr><td bgcolor="{row_color}" port="_root" colspan="{column_count}"><b>{name}</b></td></tr>"""
 
 
-TEXT_OPTION_PATTERN = re.compile(r'^Union\[(".+",?)+]$')
+def _model_description_row(row_color: str, column_count: int, description: str) -> str:
+    return f"""<tr><td bgcolor="{row_color}" port="description" colspan="{column_count}"><i>{description}</i></td></tr>"""
 
 
-def get_type_name(field: PydanticField) -> str:
-    type_name = field.type_name
+def _row(row_color: str, name: str, type_name: str) -> str:
+    return f"""<tr><td bgcolor="{row_color}" port="{name}_w">{name}</td><td bgcolor="{row_color}" port="{name}_e">{type_name}</td></tr>"""
 
-    if TEXT_OPTION_PATTERN.search(type_name):
+
+def _row_with_description(row_color: str, name: str, type_name: str, description: str) -> str:
+    return f"""<tr><td bgcolor="{row_color}" port="{name}_w"><b>{name}</b></td><td bgcolor="{row_color}">{type_name}</td><td bgcolor="{row_color}" port="{name}_e">{description}</td></tr>"""
+
+
+def _is_text_options(type_name: str) -> bool:
+    """Checks whether a type name is a union of quoted string literals, like `Union["a", "b"]`."""
+    if not (type_name.startswith('Union["') and type_name.endswith("]")):
+        return False
+    options = type_name[6:-1]
+    if "\n" in options:
+        return False
+    if options.endswith(","):
+        options = options[:-1]
+    return len(options) >= 3 and options.endswith('"')
+
+
+def _clean_type_name(type_name: str) -> str:
+    if _is_text_options(type_name):
         return "str"
 
     return type_name
 
 
+def get_type_name(field: Field) -> str:
+    if isinstance(field, PydanticField):
+        return field._display_type_name
+
+    return _clean_type_name(field.type_name)
+
+
 def split_description_lines(message: str, character_limit: int = CHARACTER_LIMIT) -> str:
     if len(message) < character_limit:
         return message
@@ -51,38 +78,42 @@ def split_description_lines(message: str, character_limit: int = CHARACTER_LIMIT
     line_separator = "\n<br></br>"
     lines: List[str] = []
 
-    message = re.sub("\n+", " ", message)
-    message = re.sub(" +", " ", message)
-
-    current_message = ""
-    message_pieces = message.split(" ")
-
-    for piece in message_pieces:
-        if current_message:
-            if len(current_message + piece) + 1 > character_limit:
-                lines.append(current_message)
-                current_message = piece
-            else:
-                current_message += " " + piece
+    current_line: List[str] = []
+    current_length = 0
+
+    for piece in message.split():
+        if current_line and current_length + len(piece) + 1 > character_limit:
+            lines.append(" ".join(current_line))
+            current_line = [piece]
+            current_length = len(piece)
+        elif current_line:
+            current_line.append(piece)
+            current_length += len(piece) + 1
         else:
-            current_message = piece
+            current_line = [piece]
+            current_length = len(piece)
 
-    if current_message:
-        lines.append(current_message)
+    if current_line:
+        lines.append(" ".join(current_line))
 
     return line_separator.join(lines)
 
 
+@lru_cache(maxsize=4096)
+def _format_description(description: str, character_limit: int = CHARACTER_LIMIT) -> str:
+    """Escapes a description for use in an HTML-like label and wraps it to the character limit."""
+    return split_description_lines(html.escape(description), character_limit)
+
+
 def get_model_name_row(name: str, column_count: int = 2) -> str:
-    return _header_template.format(name=name, column_count=column_count, row_color=HEADER_ROW_COLOR)
+    return _header_row(HEADER_ROW_COLOR, column_count, name)
 
 
 def get_description_row(description: str = None, column_count: int = 2) -> Optional[str]:
     if description:
-        description = description[0:description.index("\n\n")] if "\n\n" in description else description
-        description = html.escape(description)
-        description = split_description_lines(description, HEADER_CHARACTER_LIMIT)
-        return _model_description_template.format(description=description, column_count=column_count, row_color=DESCRIPTION_ROW_COLOR)
+        description = description.split("\n\n", 1)[0]
+        description = _format_description(description, HEADER_CHARACTER_LIMIT)
+        return _model_description_row(DESCRIPTION_ROW_COLOR, column_count, description)
     return None
 
 
@@ -98,33 +129,26 @@ def get_header_rows(name: str, description: str = None, column_count: int = 2) -
 
 
 def get_field_row(row_index: int, field: PydanticField, render_description: bool = None) -> str:
-    # The index is 0-based, but the number for the row is 1s indexed, so add 1 to get the actual row number
-    row_number = row_index + 1
-    is_odd_row = row_number % 2 == 1
-    row_color = ODD_ROW_COLOR if is_odd_row else EVEN_ROW_COLOR
+    row_color = _ROW_COLORS[row_index & 1]
+    name = field.name
+    description = field.description
 
     if render_description is None:
-        render_description = field.description is not None
+        render_description = description is not None
 
     if render_description:
-        description = field.description or ''
-
         # Format the description to make sure it doesn't stretch the row
-        description = html.escape(description)
-        description = split_description_lines(description)
-        return _row_with_description.format(name=field.name, type_name=field.type_name, description=description, row_color=row_color)
+        description = _format_description(description or '')
+        return _row_with_description(row_color, name, field.type_name, description)
 
     type_name = get_type_name(field)
 
-    return _row_template.format(name=field.name, type_name=type_name, row_color=row_color)
+    return _row(row_color, name, type_name)
 
 
 def get_field_rows(fields: List[PydanticField], render_description: bool) -> str:
     return "".join(
-        [
-            get_field_row(row_index=index, field=field, render_description=render_description)
-            for index, field in enumerate(fields)
-        ]
+        [get_field_row(index, field, render_description) for index, field in enumerate(fields)]
     )
 
 
@@ -132,7 +156,7 @@ def build_model_table(model: PydanticModel) -> str:
     column_count = 3 if model.has_field_descriptions else 2
     header = get_header_rows(name=model.name, description=model.model_description, column_count=column_count)
     rows = get_field_rows(model.fields, model.has_field_descriptions)
-    return _table_template.format(header=header, rows=rows)
+    return "".join((_TABLE_OPEN, header, rows, _TABLE_CLOSE))
 
 
 class PydanticField(Field[pydantic.fields.ModelField]):
@@ -150,21 +174,30 @@ class PydanticField(Field[pydantic.fields.ModelField]):
             )
         super().__init__(field=field)
 
-    @property
+    @cached_property
     def name(self) -> str:
         return self.field.name
 
-    @property
+    @cached_property
     def description(self) -> Optional[str]:
         return getattr(self.field.field_info, 'description', None)
 
-    @property
+    @cached_property
     def type_obj(self) -> Type:
         tp = self.field.outer_type_
         if self.field.allow_none:
             return Optional[tp]
         return tp
 
+    @cached_property
+    def type_name(self) -> str:
+        return super().type_name
+
+    @cached_property
+    def _display_type_name(self) -> str:
+        """Type name shown in a table row without a description column."""
+        return _clean_type_name(self.type_name)
+
     def is_many(self) -> bool:
         return self.field.shape > 1
 
@@ -196,24 +229,20 @@ class PydanticModel(Model[Type[pydantic.BaseModel]]):
                 f"Got {repr_type_with_mro(model)}"
             )
         super().__init__(model=model)
-        self.__fields: List[PydanticField] = [PydanticField(field=f) for f in self.model.__fields__.values()]
 
     @staticmethod
     def is_model_type(obj: Any) -> bool:
         return isinstance(obj, type) and issubclass(obj, pydantic.BaseModel)
 
-    @property
+    @cached_property
     def fields(self) -> List[PydanticField]:
-        return self.__fields
+        return [PydanticField(field=f) for f in self.model.__fields__.values()]
 
-    @property
+    @cached_property
     def has_field_descriptions(self) -> bool:
-        for field in self.fields:
-            if field.description:
-                return True
-        return False
+        return any(field.description for field in self.fields)
 
-    @property
+    @cached_property
     def model_description(self) -> Optional[str]:
         return inspect.getdoc(self.model)
 
@@ -231,30 +260,29 @@ class PydanticModel(Model[Type[pydantic.BaseModel]]):
 
     @property
     def docstring(self) -> str:
-        out = super().docstring
-        field_descriptions = [
-            getattr(field.field.field_info, "description", None) for field in self.fields
+        parts = [super().docstring]
+        described_fields = [
+            (field.name, field.type_name, field.description, field.field.field_info.default)
+            for field in self.fields
+            if field.description is not None
         ]
-        if any(descr is not None for descr in field_descriptions):
+        if described_fields:
             # Sometimes Pydantic models have field documentation as descriptions as metadata on the
             # field instead of in the docstring. If detected, construct docstring and add.
-            out += "\nAttributes:\n"
-            field_defaults = [field.field.field_info.default for field in self.fields]
-            for field, descr, default in zip(self.fields, field_descriptions, field_defaults):
-                if descr is not None:
-                    line = f"{field.name} ({field.type_name}): {descr}"
-                    if (
-                            not isinstance(default, pydantic.fields.UndefinedType)
-                            and default is not ...
-                    ):
-                        if not line.strip().endswith("."):
-                            line = line.rstrip() + ". "
-                        else:
-                            line = line.rstrip() + " "
-                        if isinstance(default, str):
-                            line += f"Default is '{default}'."
-                        else:
-                            line += f"Default is {default}."
-                    out += "    " + line.strip() + "\n"
-
-        return out
+            append = parts.append
+            append("\nAttributes:\n")
+            undefined_type = pydantic.fields.UndefinedType
+            for name, type_name, descr, default in described_fields:
+                line = f"{name} ({type_name}): {descr}"
+                if not isinstance(default, undefined_type) and default is not ...:
+                    if not line.strip().endswith("."):
+                        line = line.rstrip() + ". "
+                    else:
+                        line = line.rstrip() + " "
+                    if isinstance(default, str):
+                        line += f"Default is '{default}'."
+                    else:
+                        line += f"Default is {default}."
+                append("    " + line.strip() + "\n")
+
+        return "".join(parts)
@@ -17,6 +17,25 @@ try:
 except ImportError:
     from typing_extensions import Literal  # type: ignore # Python == 3.7.*
 
+try:
+    from functools import cached_property  # type: ignore # Python 3.8+
+except ImportError:  # Python 3.7
+
+    class cached_property:  # type: ignore
+        """Minimal backport of functools.cached_property for Python 3.7."""
+
+        def __init__(self, func):
+            self.func = func
+            self.attrname = func.__name__
+            self.__doc__ = func.__doc__
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = instance.__dict__[self.attrname] = self.func(instance)
+            return value
+
+
 from erdantic.exceptions import _StringForwardRefError, _UnevaluatedForwardRefError
 
 
@@ -34,8 +53,10 @@ def get_depth1_bases(tp: type) -> List[type]:
 
 def get_recursive_args(tp: Union[type, GenericAlias]) -> List[type]:
     """Recursively finds leaf-node types of possibly-nested generic type."""
-
-    def recurse(t):
+    leaves: List[type] = []
+    stack = [tp]
+    while stack:
+        t = stack.pop()
         if isinstance(t, str):
             raise _StringForwardRefError(forward_ref=t)
         elif isinstance(t, ForwardRef):
@@ -47,14 +68,14 @@ def get_recursive_args(tp: Union[type, GenericAlias]) -> List[type]:
         args = get_args(t)
         is_literal = Literal is not None and get_origin(t) is Literal
         if is_literal:
-            yield Literal
+            leaves.append(Literal)
         elif args:
-            for arg in args:
-                yield from recurse(arg)
+            # Push in reverse so that leaves come out in declaration order
+            stack.extend(reversed(args))
         else:
-            yield t
+            leaves.append(t)
 
-    return list(recurse(tp))
+    return leaves
 
 
 def repr_type(tp: Union[type, GenericAlias]) -> str:
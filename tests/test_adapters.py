@@ -43,6 +43,10 @@ def test_is_model_type(model_class, examples):
         attr: str
 
     assert not model_class.is_model_type(JustAClass)
+    # Instances and other objects that aren't classes are never model types
+    assert not model_class.is_model_type(JustAClass())
+    assert not model_class.is_model_type(1)
+    assert not model_class.is_model_type("Party")
 
 
 def test_model_graph_search(examples):
@@ -153,7 +157,9 @@ def test_to_dot(key, examples, version_patch):
 def test_registration(key):
     script = textwrap.dedent(
         f"""\
-        from erdantic.base import model_adapter_registry;
+        from erdantic.base import get_model_adapter, model_adapter_registry;
+        assert "{key}" not in model_adapter_registry;
+        get_model_adapter("{key}");
         assert "{key}" in model_adapter_registry;
         """
     ).replace("\n", "")
@@ -1,7 +1,21 @@
+import gc
+import subprocess
+import textwrap
+import weakref
+
+import pydantic
 import pytest
 
 import erdantic as erd
-from erdantic.base import Field, get_model_adapter, Model, register_model_adapter
+from erdantic.base import (
+    clear_model_adapter_cache,
+    Field,
+    find_model_adapter,
+    get_model_adapter,
+    Model,
+    model_adapter_registry,
+    register_model_adapter,
+)
 from erdantic.examples.pydantic import Party
 from erdantic.exceptions import InvalidModelAdapterError, ModelAdapterNotFoundError
 from erdantic.pydantic import PydanticModel
@@ -34,6 +48,11 @@ def test_repr():
     assert repr(diagram.models[0].fields[0]) and isinstance(repr(diagram.models[0].fields[0]), str)
 
 
+def test_field_index():
+    model = PydanticModel(Party)
+    assert [model.field_index[field] for field in model.fields] == list(range(len(model.fields)))
+
+
 def test_get_model_adapter():
     assert get_model_adapter("pydantic") == PydanticModel
     assert get_model_adapter(PydanticModel) == PydanticModel
@@ -41,3 +60,112 @@ def test_get_model_adapter():
         get_model_adapter("unknown_key")
     with pytest.raises(InvalidModelAdapterError):
         get_model_adapter(Party)
+
+
+def test_find_model_adapter():
+    assert find_model_adapter(Party) is PydanticModel
+    assert find_model_adapter(str) is None
+    assert find_model_adapter([str]) is None
+
+    # Registering a new adapter invalidates cached lookups
+    class StrModel(Model[str]):
+        def __init__(self, model: type):
+            super().__init__(model=model)
+
+        @staticmethod
+        def is_model_type(obj) -> bool:
+            return obj is str
+
+        @property
+        def fields(self):
+            return []
+
+    try:
+        register_model_adapter("str")(StrModel)
+        assert find_model_adapter(str) is StrModel
+    finally:
+        del model_adapter_registry["str"]
+        clear_model_adapter_cache()
+    assert find_model_adapter(str) is None
+
+
+def test_find_model_adapter_weak_cache():
+    DynamicModel = pydantic.create_model("DynamicModel", name=(str, ...))
+    assert find_model_adapter(DynamicModel) is PydanticModel
+    model_ref = weakref.ref(DynamicModel)
+    del DynamicModel
+    gc.collect()
+    assert model_ref() is None
+
+
+def test_find_model_adapter_non_type():
+    class Metadata:
+        def __eq__(self, other):
+            raise RuntimeError("Metadata can't be compared")
+
+        __hash__ = object.__hash__
+
+    metadata = Metadata()
+    # Objects other than classes, e.g., Annotated metadata, are never cached or compared
+    assert find_model_adapter(metadata) is None
+    assert find_model_adapter(metadata) is None
+
+
+def test_lazy_model_adapters():
+    script = textwrap.dedent(
+        """\
+        import dataclasses, sys;
+        import erdantic as erd;
+        assert "erdantic.dataclasses" not in sys.modules;
+        assert "erdantic.pydantic" not in sys.modules;
+        assert "erdantic.version" not in sys.modules;
+        Model = dataclasses.make_dataclass("Model", [("name", str)]);
+        erd.create(Model).to_dot();
+        assert "erdantic.dataclasses" in sys.modules;
+        assert "pygraphviz" not in sys.modules;
+        assert "pydantic" not in sys.modules;
+        assert erd.pydantic.PydanticModel;
+        assert erd.__version__;
+        """
+    ).replace("\n", "")
+
+    result = subprocess.run(
+        ["python", "-c", script],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_lazy_model_adapters_keep_override():
+    script = textwrap.dedent(
+        """\
+        import pydantic
+        from erdantic.base import (
+            Model, find_model_adapter, get_model_adapter, register_model_adapter
+        )
+
+        @register_model_adapter("pydantic")
+        class MyAdapter(Model):
+            @staticmethod
+            def is_model_type(obj):
+                return isinstance(obj, type) and issubclass(obj, pydantic.BaseModel)
+
+        class P(pydantic.BaseModel):
+            x: int
+
+        assert find_model_adapter(P) is MyAdapter
+        assert find_model_adapter(int) is None
+        assert find_model_adapter(P) is MyAdapter
+        assert get_model_adapter("pydantic") is MyAdapter
+        """
+    )
+
+    result = subprocess.run(
+        ["python", "-c", script],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    assert result.returncode == 0, result.stderr
@@ -184,6 +184,23 @@ def test_dot(tmp_path):
     assert erd.to_dot(Party).strip() == result.stdout.strip()
 
 
+def test_import_is_lazy():
+    """Importing the CLI shouldn't import model adapters or their frameworks, or pygraphviz."""
+    script = (
+        "import sys; import erdantic.cli; "
+        "from erdantic.base import model_adapter_registry; "
+        "assert not model_adapter_registry; "
+        "assert not {'pydantic', 'pygraphviz'} & set(sys.modules)"
+    )
+    result = subprocess.run(
+        ["python", "-c", script],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
 def test_help():
     """Test the CLI with --help flag."""
     result = runner.invoke(app, ["--help"])
@@ -1,5 +1,7 @@
+import dataclasses
 import filecmp
 import imghdr
+from types import ModuleType
 
 import pytest
 
@@ -28,6 +30,15 @@ def test_diagram_comparisons():
     assert diagram1 not in [diagram3]
 
 
+def test_dot_independent_of_model_order():
+    diagram = erd.create(Party)
+    reversed_diagram = erd.EntityRelationshipDiagram(
+        models=list(reversed(diagram.models)), edges=list(reversed(diagram.edges))
+    )
+    assert reversed_diagram.name == diagram.name
+    assert reversed_diagram.to_dot() == diagram.to_dot()
+
+
 def test_edge_comparisons():
     diagram = erd.create(Party)
     edges = diagram.edges
@@ -128,6 +139,62 @@ def test_create_with_modules():
     }
 
 
+def test_search_reaches_models_at_shallowest_depth():
+    @dataclasses.dataclass
+    class D:
+        name: str
+
+    @dataclasses.dataclass
+    class C:
+        d: D
+
+    @dataclasses.dataclass
+    class B:
+        c: C
+
+    @dataclasses.dataclass
+    class A:
+        b: B
+        c: C
+
+    # C is two levels deep through B but one level deep directly from A, so it's expanded
+    diagram = erd.create(A, depth_limit=2)
+    assert [m.name for m in diagram.models] == ["A", "B", "C", "D"]
+    assert {(e.source.name, e.target.name) for e in diagram.edges} == {
+        ("A", "B"),
+        ("A", "C"),
+        ("B", "C"),
+        ("C", "D"),
+    }
+
+
+def test_create_with_modules_independent_of_order():
+    @dataclasses.dataclass
+    class C:
+        name: str
+
+    @dataclasses.dataclass
+    class B:
+        c: C
+
+    @dataclasses.dataclass
+    class A:
+        b: B
+
+    def make_module(*classes):
+        module = ModuleType("erdantic_test_models")
+        for cls in classes:
+            cls.__module__ = module.__name__
+            setattr(module, cls.__name__, cls)
+        return module
+
+    forward = erd.create(make_module(A, B, C))
+    backward = erd.create(make_module(C, B, A))
+    assert {(e.source.name, e.target.name) for e in forward.edges} == {("A", "B"), ("B", "C")}
+    assert forward.edges == backward.edges
+    assert erd.create(A, B).edges == erd.create(B, A).edges
+
+
 def test_draw_with_modules(tmp_path):
     # use EntityRelationshipDiagram.draw as expected
     expected_path = tmp_path / "expected.png"
@@ -191,6 +258,46 @@ def test_repr_svg():
     assert svg and isinstance(svg, str)
 
 
+def test_graph():
+    diagram = erd.create(Party, orientation=erd.Orientation.VERTICAL)
+    graph = diagram.graph()
+    assert graph.is_directed()
+    assert not graph.is_strict()
+    assert graph.graph_attr["rankdir"] == "TB"
+    assert graph.node_attr["shape"] == "plain"
+    assert set(graph.nodes()) == {model.key for model in diagram.models}
+    assert len(graph.edges()) == len(diagram.edges)
+    for edge in diagram.edges:
+        graph_edge = graph.get_edge(edge.source.key, edge.target.key)
+        assert graph_edge.attr["arrowhead"] == edge.dot_arrowhead()
+
+
+def test_orientation():
+    assert str(erd.Orientation.VERTICAL) == "TB"
+    assert f"{erd.Orientation.HORIZONTAL}" == "LR"
+    assert erd.create(Party, orientation=erd.Orientation.HORIZONTAL).orientation == "LR"
+    assert erd.create(Party, orientation="LR").orientation == "LR"
+
+
+def test_render_does_not_change_dot(tmp_path):
+    diagram = erd.create(Party)
+    dot = diagram.to_dot()
+    diagram.draw(tmp_path / "diagram.png")
+    diagram._repr_svg_()
+    assert diagram.to_dot() == dot
+    assert diagram.graph() is not diagram.graph()
+
+
+def test_draw_with_dot(tmp_path):
+    diagram = erd.create(Party)
+    expected_path = tmp_path / "expected.png"
+    diagram.draw(expected_path)
+
+    path = tmp_path / "diagram.png"
+    diagram.draw(path, dot=diagram.to_dot())
+    assert filecmp.cmp(path, expected_path)
+
+
 def test_find_models():
     expected_pydantic_models = {
         examples_pydantic.Party,
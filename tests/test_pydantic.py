@@ -1,3 +1,4 @@
+import dataclasses
 import textwrap
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -5,8 +6,9 @@ from pydantic import BaseModel, Field
 import pytest
 
 import erdantic as erd
+from erdantic.dataclasses import DataClassModel
 from erdantic.exceptions import UnevaluatedForwardRefError
-from erdantic.pydantic import PydanticModel
+from erdantic.pydantic import get_field_rows, get_type_name, PydanticModel, _is_text_options
 
 
 def test_model_graph_search_nested_args():
@@ -126,3 +128,50 @@ def test_docstring_field_descriptions():
         """
     )
     assert model.docstring == expected
+
+
+@pytest.mark.parametrize(
+    "type_name, expected",
+    [
+        ('Union["a", "b"]', True),
+        ('Union["a",]', True),
+        ('Union["a"]', True),
+        ('Union[""]', False),
+        ("Union[str, int]", False),
+        ('Optional[Union["a", "b"]]', False),
+        ('Union["a", "b"', False),
+    ],
+)
+def test_is_text_options(type_name, expected):
+    assert _is_text_options(type_name) is expected
+
+
+def test_field_rows():
+    class MyClass(BaseModel):
+        a: int
+        b: Optional[str] = Field(None, description="A <b>string</b>.")
+
+    model = PydanticModel(MyClass)
+    assert get_field_rows(model.fields, render_description=False) == (
+        '<tr><td bgcolor="#FFFFFF" port="a_w">a</td><td bgcolor="#FFFFFF" port="a_e">int</td></tr>'
+        '<tr><td bgcolor="#e3e3e3" port="b_w">b</td>'
+        '<td bgcolor="#e3e3e3" port="b_e">Optional[str]</td></tr>'
+    )
+    assert get_field_rows(model.fields, render_description=True) == (
+        '<tr><td bgcolor="#FFFFFF" port="a_w"><b>a</b></td><td bgcolor="#FFFFFF">int</td>'
+        '<td bgcolor="#FFFFFF" port="a_e"></td></tr>'
+        '<tr><td bgcolor="#e3e3e3" port="b_w"><b>b</b></td><td bgcolor="#e3e3e3">Optional[str]</td>'
+        '<td bgcolor="#e3e3e3" port="b_e">A &lt;b&gt;string&lt;/b&gt;.</td></tr>'
+    )
+
+
+def test_get_type_name():
+    class MyClass(BaseModel):
+        a: Optional[int]
+
+    @dataclasses.dataclass
+    class MyDataClass:
+        a: Optional[int]
+
+    assert get_type_name(PydanticModel(MyClass).fields[0]) == "Optional[int]"
+    assert get_type_name(DataClassModel(MyDataClass).fields[0]) == "Optional[int]"
@@ -1,6 +1,8 @@
 from enum import Enum, IntFlag
+import gc
 import sys
 import typing
+import weakref
 
 from typing import ForwardRef  # docs claim Python >= 3.7.4 but actually it's in Python 3.7.0+
 
@@ -35,6 +37,17 @@ def test_get_recursive_args():
         assert get_recursive_args(Literal["batman"]) in [[Literal], [Literal["batman"]]]
 
 
+def test_get_recursive_args_does_not_keep_types_alive():
+    class Leaf:
+        pass
+
+    assert get_recursive_args(Leaf) == [Leaf]
+    leaf_ref = weakref.ref(Leaf)
+    del Leaf
+    gc.collect()
+    assert leaf_ref() is None
+
+
 def test_get_depth1_bases():
     class A0:
         pass